@@ -0,0 +1,146 @@
+import tracemalloc
+from time import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from utility import TranslationServiceProvider, get_encoding
+from translation import Translation
+from process import translate_content
+from deadline import Deadline
+from config.openai_config import OPENAI_INPUT_TOKEN_LENGTH
+
+
+BENCHMARK_PAGE_COUNT = 1000
+# a question as laid out in the mini-test pdfs, repeated to fill a page
+BENCHMARK_QUESTION = [
+    "Q{0}. Consider the following statements regarding the Government of India Act, 1935:",
+    "1. It provided for an All-India Federation.",
+    "2. It abolished dyarchy in the provinces.",
+    "Which of the statements given above is/are correct?",
+    "(a) 1 only",
+    "(b) 2 only",
+    "(c) Both 1 and 2",
+    "(d) Neither 1 nor 2",
+]
+BENCHMARK_QUESTIONS_PER_PAGE = 5
+BENCHMARK_SERVICE_NAME = "openai"
+
+
+def generate_lines(page_count=BENCHMARK_PAGE_COUNT, questions_per_page=BENCHMARK_QUESTIONS_PER_PAGE):
+    """
+    Generates synthetic extracted lines, one page at a time, split out of the
+    page text the same way PdfProcessor does.
+
+    Args:
+    - page_count (int): Number of pages.
+    - questions_per_page (int): Number of questions per page.
+
+    Yields:
+    str: One extracted line.
+    """
+    page_text = "\n".join(BENCHMARK_QUESTION * questions_per_page)
+    for page in range(page_count):
+        yield from page_text.format(page + 1).split("\n")
+
+
+class StubTranslate(Translation):
+    """
+    Stands in for the translation service; returns a new string of the same size.
+    """
+
+    def translate(self):
+        return self._Translation__input_text.upper()
+
+
+def get_stub_provider():
+    """
+    Returns:
+    TranslationServiceProvider: provider translating with StubTranslate.
+    """
+    return TranslationServiceProvider(
+        service_name=BENCHMARK_SERVICE_NAME, processor_mapping={BENCHMARK_SERVICE_NAME: StubTranslate}
+    )
+
+
+def legacy_chunks(file_data):
+    """
+    Chunks the lines the way Tokenize did before TextChunk: one single-element
+    list holding a joined copy of each chunk.
+
+    Yields:
+    list: List containing sentences with maximum token length.
+    """
+    token = get_encoding()
+    file_length = len(file_data)
+    count = 0
+    start = 0
+    for i in range(file_length):
+        l = len(token.encode(file_data[i]))
+        if (l >= OPENAI_INPUT_TOKEN_LENGTH) or (i == file_length-1):
+            yield [", ".join(file_data[start:i+1])]
+            start = i+1
+            l = 0
+            count = 0
+        count += l
+        if count > OPENAI_INPUT_TOKEN_LENGTH:
+            yield [", ".join(file_data[start:i])]
+            start = i
+            count = 0
+
+
+def legacy_pipeline(page_count):
+    """
+    Runs the previous process.execute path: the full extracted line list,
+    joined chunk copies and the result list all held at the same time.
+    """
+    translate = get_stub_provider()
+    content = list(generate_lines(page_count))
+    with ThreadPoolExecutor(5) as executor:
+        result = executor.map(translate.get_translated_data, legacy_chunks(content))
+    output = list(result)
+    return len(output)
+
+
+def compact_pipeline(page_count):
+    """
+    Runs the current process.execute path (process.translate_content): lines
+    streamed into one shared buffer and chunks passed around as TextChunk views.
+    """
+    output = translate_content(get_stub_provider(), generate_lines(page_count), Deadline())
+    return len(output)
+
+
+def measure(pipeline, page_count):
+    """
+    Measures run time and peak traced memory of a pipeline.
+
+    Returns:
+    tuple: seconds taken, peak memory in bytes and number of chunks.
+    """
+    tracemalloc.start()
+    ts = time()
+    chunk_count = pipeline(page_count)
+    seconds = time() - ts
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, chunk_count
+
+
+def main():
+    """
+    Reports peak memory of the legacy and compact chunk representations.
+    """
+    # load the encoding outside of the measured region
+    get_encoding()
+    results = {}
+    for name, pipeline in (("legacy", legacy_pipeline), ("compact", compact_pipeline)):
+        results[name] = measure(pipeline, BENCHMARK_PAGE_COUNT)
+
+    print(f"\n{BENCHMARK_PAGE_COUNT} pages, chunk size {OPENAI_INPUT_TOKEN_LENGTH} tokens")
+    for name, (seconds, peak, chunk_count) in results.items():
+        print(f"{name:>8}: {chunk_count} chunks, peak memory {peak / 2**20:.2f} MiB, took {seconds:.2f} seconds")
+    print(f"peak memory reduction: {results['legacy'][1] / results['compact'][1]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,3 +18,11 @@ SAMPLE_INPUT_DOC_FILE_PATH = os.path.join(INPUT_FOLDER_PATH, SAMPLE_DOC_FILE_NAM
 
 OUTPUT_FOLDER_NAME = "translation_outputs"
 OUTPUT_FOLDER_PATH = os.path.join(BASE_FOLDER_PATH, OUTPUT_FOLDER_NAME)
+
+
+# extracted docx text is cached here by file hash so reruns skip parsing,
+# set CACHE_FOLDER_PATH to None to disable the cache
+CACHE_FOLDER_NAME = "translation_cache"
+CACHE_FOLDER_PATH = os.path.join(BASE_FOLDER_PATH, CACHE_FOLDER_NAME)
+# least recently used entries are removed once the cache grows past this size
+CACHE_MAX_SIZE_BYTES = 500 * 1024 * 1024
@@ -26,4 +26,11 @@ class InputMessages(Enum):
     
 class InvalidInputMessages(Enum):
     INVALID_FILE_TYPE = f"INVALID FILE TYPE PROVIDED. PLEASE SELECT ANYTHING AMONG THESE : {FileTypes.get_list()}"
-    INVALID_SERVICE_TYPE = f"INVALID SERVICE TYPE PROVIDED. PLEASE SELECT ANYTHING AMONG THESE : {TranlatorTypes.get_list()}"
\ No newline at end of file
+    INVALID_SERVICE_TYPE = f"INVALID SERVICE TYPE PROVIDED. PLEASE SELECT ANYTHING AMONG THESE : {TranlatorTypes.get_list()}"
+    
+class ServerMessages(Enum):
+    NOT_FOUND = "ENDPOINT NOT FOUND"
+    EMPTY_REQUEST = "NO TEXT OR FILE PROVIDED IN THE REQUEST BODY"
+    INVALID_CONTENT_LENGTH = "CONTENT-LENGTH HEADER MUST BE A NON-NEGATIVE INTEGER"
+    INVALID_TEXT_ENCODING = "REQUEST BODY IS NOT VALID UTF-8 TEXT"
+    UNREADABLE_FILE = "UPLOADED FILE COULD NOT BE READ"
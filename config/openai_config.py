@@ -12,8 +12,17 @@ FIRST_PROMPT_INSTRUCTION = '''Translate the following {src_lang} text to {desc_l
 VALIDATE_TRANSLATION_INSTRUCTION = "correct the translation text in {desc_lang} to make the flow better and more consistent with theme of questions and options"
 
 
-MAXIMUM_RETRY_VALUE = 5
-
 OPENAI_MODEL = "gpt-3.5-turbo"
 
-OPENAI_INPUT_TOKEN_LENGTH = 500
\ No newline at end of file
+OPENAI_INPUT_TOKEN_LENGTH = 500
+
+# retry budget for rate limited, timed out or failed calls, per api call (the sdk does not retry)
+MAXIMUM_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_WAIT_SECONDS = 5
+
+# deadlines for a translation run and for each chunk within it
+RUN_TIMEOUT_SECONDS = 60 * 60
+CHUNK_TIMEOUT_SECONDS = 3 * 60
+
+# time in-flight chunks get to finish once a run is cancelled, a second signal skips it
+DRAIN_GRACE_SECONDS = 30
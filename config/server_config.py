@@ -0,0 +1,13 @@
+'''config file to store translation service (http server) settings'''
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8080
+
+# number of worker threads shared by all requests for upstream translation calls
+SERVER_WORKER_COUNT = 5
+
+TRANSLATE_ENDPOINT = "/translate"
+HEALTH_ENDPOINT = "/health"
+
+# providers kept warm per (service, src, dest); least recently used ones are dropped beyond this
+SERVER_PROVIDER_CACHE_SIZE = 64
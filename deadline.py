@@ -0,0 +1,115 @@
+import threading
+from time import monotonic
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when a translation run or chunk runs out of time or is cancelled.
+    """
+    pass
+
+
+class Deadline:
+    """
+    Time budget propagated from a translation run down to each API call.
+
+    A child deadline never outlives its parent and shares the parent's
+    cancellation events, so cancelling a run stops all of its queued chunks.
+
+    Attributes:
+    - __expires_at (float): monotonic time the deadline expires at, None for no limit.
+    - __parent (Deadline): enclosing deadline, None for a run deadline.
+    - __cancel_event (threading.Event): event set when the run is cancelled.
+    - __abort_event (threading.Event): event set when the run should not wait
+      for its in-flight chunks either.
+    """
+
+    def __init__(self, timeout=None, parent=None) -> None:
+        """
+        Initializes the Deadline object.
+
+        Args:
+        - timeout (float): seconds from now until the deadline expires, None for no limit.
+        - parent (Deadline): enclosing deadline.
+        """
+        self.__expires_at = None if timeout is None else monotonic() + timeout
+        self.__parent = parent
+        self.__cancel_event = parent.cancel_event if parent else threading.Event()
+        self.__abort_event = parent.abort_event if parent else threading.Event()
+
+    @property
+    def cancel_event(self):
+        return self.__cancel_event
+
+    @property
+    def abort_event(self):
+        return self.__abort_event
+
+    def child(self, timeout=None):
+        """
+        Creates a deadline bounded by this one, e.g. for a single chunk.
+
+        Args:
+        - timeout (float): seconds from now until the child expires, None for no extra limit.
+
+        Returns:
+        Deadline: child deadline.
+        """
+        return Deadline(timeout, parent=self)
+
+    def remaining(self):
+        """
+        Returns:
+        float: seconds left, never negative, None if there is no limit.
+        """
+        remaining = None
+        if self.__expires_at is not None:
+            remaining = max(self.__expires_at - monotonic(), 0)
+        if self.__parent is not None:
+            parent_remaining = self.__parent.remaining()
+            if remaining is None or (parent_remaining is not None and parent_remaining < remaining):
+                remaining = parent_remaining
+        return remaining
+
+    def cancel(self):
+        """
+        Cancels the run this deadline belongs to.
+        """
+        self.__cancel_event.set()
+
+    def cancelled(self):
+        return self.__cancel_event.is_set()
+
+    def abort(self):
+        """
+        Cancels the run and stops waiting for its in-flight chunks.
+        """
+        self.__cancel_event.set()
+        self.__abort_event.set()
+
+    def aborted(self):
+        return self.__abort_event.is_set()
+
+    def expired(self):
+        """
+        Returns:
+        bool: True if the deadline has passed or the run was cancelled.
+        """
+        return self.cancelled() or self.remaining() == 0
+
+    def check(self):
+        """
+        Raises DeadlineExceeded if the deadline has passed or the run was cancelled.
+        Used before a chunk starts, so queued chunks are skipped on cancellation.
+        """
+        if self.cancelled():
+            raise DeadlineExceeded("translation run was cancelled")
+        self.check_time()
+
+    def check_time(self):
+        """
+        Raises DeadlineExceeded if the deadline has passed. Used while a chunk is
+        running, so cancelling the run lets in-flight chunks finish within their time.
+        """
+        if self.remaining() == 0:
+            raise DeadlineExceeded("translation deadline exceeded")
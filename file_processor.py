@@ -1,8 +1,60 @@
 import os
+import contextlib
+import hashlib
+import tempfile
+import zipfile
 from abc import ABC, abstractmethod
 import docx2txt
+from lxml import etree
 from PyPDF2 import PdfReader
 
+from config.file_config import CACHE_FOLDER_PATH, CACHE_MAX_SIZE_BYTES
+
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+WORD_DOCUMENT_PATH = "word/document.xml"
+HASH_BLOCK_SIZE = 1024 * 1024
+# bump whenever parse_paragraphs output changes, to invalidate cached extractions
+DOCX_PARSER_VERSION = 2
+
+
+def get_file_hash(file):
+    """
+    Computes the sha256 hash of a file, reading it in blocks.
+
+    Args:
+    - file: file path in str
+
+    Returns:
+    str: hex digest of the file content.
+    """
+    file_hash = hashlib.sha256()
+    with open(file, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def prune_cache(cache_folder, max_size=CACHE_MAX_SIZE_BYTES):
+    """
+    Removes the least recently used cache entries until the folder fits in max_size.
+
+    Args:
+    - cache_folder (str): cache folder path.
+    - max_size (int): maximum total size of the cache entries in bytes.
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_folder)
+                   if entry.is_file() and entry.name.endswith(".txt")]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        total = 0
+        for entry in entries:
+            total += entry.stat().st_size
+            if total > max_size:
+                os.remove(entry.path)
+    except OSError as e:
+        print(f"extraction cache prune failed : {e}")
+
 
 class ProcessFiles(ABC):
     """
@@ -86,6 +138,18 @@ class PdfProcessor(ProcessFiles):
         content = [x.extract_text().strip().split("\n") for x in file_data.pages]
         result = [j for sub in content for j in sub]
         return result
+    
+    
+    def iter_data_per_line(self):
+        """
+        Yields data per line from the PDF file, extracting one page at a time.
+
+        Yields:
+        str: One line of the PDF file.
+        """
+        file_data = self.extract_data()
+        for page in file_data.pages:
+            yield from page.extract_text().strip().split("\n")
 
     
 class DocProcessor(ProcessFiles):
@@ -116,4 +180,133 @@ class DocProcessor(ProcessFiles):
         # return text
         lines = text.split('\n')
         return lines
-    
\ No newline at end of file
+    
+    
+    def iter_paragraphs(self, cache_folder=CACHE_FOLDER_PATH):
+        """
+        Yields the non-empty paragraphs of the DOCX file one at a time.
+
+        Results are cached by file hash, so a rerun on the same file reads the
+        cached text instead of parsing the document again. Any cache I/O error
+        is treated as a cache miss and the document is parsed as usual.
+
+        Args:
+        - cache_folder (str): folder to store extracted text in, None to disable caching.
+
+        Yields:
+        str: One line of paragraph text.
+        """
+        if cache_folder is None:
+            yield from self.parse_paragraphs()
+            return
+
+        # the parser version is part of the key, so entries written by an
+        # older parser are not served after its output changes
+        cache_path = os.path.join(
+            cache_folder, f"{get_file_hash(self.file)}_v{DOCX_PARSER_VERSION}.txt"
+        )
+        try:
+            cache_file = open(cache_path, "r", encoding="utf-8", newline="\n")
+        except OSError:
+            cache_file = None
+        if cache_file is not None:
+            with cache_file:
+                # mark the entry as recently used for pruning
+                with contextlib.suppress(OSError):
+                    os.utime(cache_path)
+                for line in cache_file:
+                    yield line.rstrip("\n")
+            return
+
+        try:
+            os.makedirs(cache_folder, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_folder, suffix=".tmp")
+            temp_file = os.fdopen(fd, "w", encoding="utf-8", newline="\n")
+        except OSError as e:
+            print(f"extraction cache unavailable : {e}")
+            yield from self.parse_paragraphs()
+            return
+
+        try:
+            for line in self.parse_paragraphs():
+                if temp_file is not None:
+                    try:
+                        temp_file.write(line + "\n")
+                    except OSError as e:
+                        print(f"extraction cache write failed : {e}")
+                        with contextlib.suppress(OSError):
+                            temp_file.close()
+                        temp_file = None
+                yield line
+            if temp_file is not None:
+                # only a fully extracted document is moved into the cache
+                try:
+                    temp_file.close()
+                    os.replace(temp_path, cache_path)
+                except OSError as e:
+                    print(f"extraction cache write failed : {e}")
+                temp_file = None
+                prune_cache(cache_folder)
+        finally:
+            with contextlib.suppress(OSError):
+                if temp_file is not None:
+                    temp_file.close()
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+    
+    
+    def parse_paragraphs(self):
+        """
+        Streams `word/document.xml` with lxml iterparse and yields the text of
+        each non-empty paragraph, clearing parsed elements to keep memory constant.
+
+        Yields:
+        str: One line of paragraph text.
+        """
+        text_tags = {f"{WORD_NAMESPACE}t": None, f"{WORD_NAMESPACE}tab": "\t",
+                     f"{WORD_NAMESPACE}br": "\n", f"{WORD_NAMESPACE}cr": "\n"}
+        with zipfile.ZipFile(self.file) as docx, docx.open(WORD_DOCUMENT_PATH) as document:
+            for _event, paragraph in etree.iterparse(document, events=("end",), tag=f"{WORD_NAMESPACE}p",
+                                                        huge_tree=True):
+                parts = []
+                for element in paragraph.iter(*text_tags):
+                    parts.append(text_tags[element.tag] or element.text or "")
+                # line breaks inside a paragraph give separate lines, as docx2txt does
+                for line in "".join(parts).split("\n"):
+                    if line.strip():
+                        yield line
+
+                # nested paragraphs (e.g. inside a w:txbxContent text box) are read
+                # on their own, so their text is not repeated in the outer paragraph
+                paragraph.clear(keep_tail=True)
+                if self.has_paragraph_ancestor(paragraph):
+                    # the outer paragraph is still being parsed, keep its earlier runs
+                    continue
+
+                # drop everything already parsed, including finished table rows and
+                # cells around the paragraph, so only the current path stays in memory
+                element = paragraph
+                while element is not None:
+                    parent = element.getparent()
+                    while element.getprevious() is not None:
+                        del parent[0]
+                    element = parent
+    
+    
+    @staticmethod
+    def has_paragraph_ancestor(element):
+        """
+        Checks whether the element is nested inside a paragraph.
+
+        Args:
+        - element (lxml.etree._Element): parsed element.
+
+        Returns:
+        bool: True if a w:p element encloses the element.
+        """
+        parent = element.getparent()
+        while parent is not None:
+            if parent.tag == f"{WORD_NAMESPACE}p":
+                return True
+            parent = parent.getparent()
+        return False
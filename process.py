@@ -3,21 +3,29 @@ from multiprocessing.pool import Pool, ThreadPool
 
 from time import time
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import os
+import signal
+import sys
 
 from utility import (
     TranslationServiceProvider,
     FileDataExtractor,
     Tokenize,
 )
+from deadline import Deadline, DeadlineExceeded
 from config.file_config import (
     BASE_FOLDER_PATH,
     SAMPLE_INPUT_DOC_FILE_PATH,
     SAMPLE_INPUT_PDF_FILE_PATH,
     OUTPUT_FOLDER_PATH,
 )
-from config.openai_config import OPENAI_INPUT_TOKEN_LENGTH
+from config.openai_config import (
+    OPENAI_INPUT_TOKEN_LENGTH,
+    RUN_TIMEOUT_SECONDS,
+    CHUNK_TIMEOUT_SECONDS,
+    DRAIN_GRACE_SECONDS,
+)
 from config.message_config import InputMessages, DefaultLanguages
 
 
@@ -38,22 +46,117 @@ def collect_file(file_type):
 
 
 
-def store_output_to_file(process, output):
+def get_missing_chunks(output):
+    """
+    Finds the chunks without a translation.
+
+    Args:
+    - output (list): List of output items.
+
+    Returns:
+    list: Indexes of chunks that failed, timed out or never ran.
+    """
+    return [index for index, item in enumerate(output) if item is None]
+
+
+def store_output_to_file(process, output, is_partial=False):
     """
     Stores output to a file.
 
     Args:
     - process (str): Name of the process.
     - output (list): List of output items.
+    - is_partial (bool): True if some chunks are missing; the output then goes to a
+      separate file so a previous complete output is not overwritten.
     """
-    output_file_name = f"output_{process}_chunk_{OPENAI_INPUT_TOKEN_LENGTH}.txt"
+    suffix = "_partial" if is_partial else ""
+    output_file_name = f"output_{process}_chunk_{OPENAI_INPUT_TOKEN_LENGTH}{suffix}.txt"
     output_file_path = os.path.join(OUTPUT_FOLDER_PATH, output_file_name)
     with open(output_file_path, "w", encoding="utf-16") as file:
         for item in output:
-            file.write("{}\n".format(item))
+            # chunks that failed or never ran are left as empty lines
+            file.write("{}\n".format("" if item is None else item))
 
 
-def execute(process, file_type, file_path, src, dest):
+def translate_chunk(translate, deadline, chunk):
+    """
+    Translates one chunk within its own deadline, started when the chunk is picked up.
+
+    Args:
+    - translate (TranslationServiceProvider): provider object.
+    - deadline (Deadline): Deadline of the whole run.
+    - chunk (TextChunk): Chunk to translate.
+
+    Returns:
+    str: Translated text.
+    """
+    # queued chunks are skipped once the run is cancelled or out of time
+    deadline.check()
+    return translate.get_translated_data(chunk, deadline.child(CHUNK_TIMEOUT_SECONDS))
+
+
+def wait_for_chunks(futures, deadline, poll_interval=1):
+    """
+    Waits until all chunks are done, the run deadline passes or the run is cancelled.
+
+    Args:
+    - futures (list): Futures of the submitted chunks.
+    - deadline (Deadline): Deadline of the whole run.
+    - poll_interval (float): Seconds between cancellation checks.
+    """
+    pending = set(futures)
+    while pending and not deadline.expired():
+        remaining = deadline.remaining()
+        timeout = poll_interval if remaining is None else min(poll_interval, remaining)
+        _done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+
+def drain_chunks(futures, deadline, grace=DRAIN_GRACE_SECONDS, poll_interval=1):
+    """
+    Waits for in-flight chunks after the run is cancelled, at most for the grace
+    period and not at all once the run is aborted. Chunks still running after
+    that are left out of the output.
+
+    Args:
+    - futures (list): Futures of the submitted chunks.
+    - deadline (Deadline): Deadline of the whole run.
+    - grace (float): Seconds the in-flight chunks get to finish.
+    - poll_interval (float): Seconds between abort checks.
+    """
+    drain = Deadline(grace)
+    pending = {future for future in futures if not future.done()}
+    while pending and not deadline.aborted() and not drain.expired():
+        timeout = min(poll_interval, drain.remaining())
+        _done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+
+def collect_result(index, future):
+    """
+    Returns the translated text of a chunk, None if it failed, timed out or did not finish.
+
+    Args:
+    - index (int): Position of the chunk in the document.
+    - future (Future): Future of the chunk.
+
+    Returns:
+    str: Translated text.
+    """
+    if future.cancelled():
+        print(f"chunk {index} was cancelled")
+        return None
+    if not future.done():
+        print(f"chunk {index} was still running")
+        return None
+    try:
+        return future.result()
+    except DeadlineExceeded as e:
+        print(f"chunk {index} stopped : {e}")
+    except Exception as e:
+        print(f"chunk {index} failed : {e}")
+    return None
+
+
+def execute(process, file_type, file_path, src, dest, deadline=None):
     """
     Executes translation process.
 
@@ -63,11 +166,13 @@ def execute(process, file_type, file_path, src, dest):
     - file_path (str): Path of the file.
     - src (str): Source language.
     - dest (str): Destination language.
+    - deadline (Deadline): Deadline of the whole run, cancelling it stops the run.
 
     Returns:
-    tuple: Boolean indicating success or failure, and output data.
+    tuple: Boolean indicating success or failure, and output data. On timeout or
+    cancellation the output holds the chunks finished so far, None for the others.
     """
-    result = []
+    deadline = deadline or Deadline(RUN_TIMEOUT_SECONDS)
     status, content = FileDataExtractor(
         file_path=file_path, file_type=file_type
     ).get_file_data()
@@ -82,18 +187,67 @@ def execute(process, file_type, file_path, src, dest):
     if not service_verify:
         return service_verify, msg
 
-    with ThreadPoolExecutor(5) as executor:
-        # func = partial(translate.get_translated_data, process)
-        result = executor.map(
-            translate.get_translated_data, Tokenize(content).sent_max_token()
-        )
+    output = translate_content(translate, content, deadline)
 
     print("Took %s seconds to translate", time() - ts)
 
-    output = list(result)
     return True, output
 
 
+def translate_content(translate, content, deadline):
+    """
+    Chunks the extracted lines and translates the chunks in parallel.
+
+    Args:
+    - translate (TranslationServiceProvider): provider object.
+    - content (iterable): Extracted lines of the file.
+    - deadline (Deadline): Deadline of the whole run.
+
+    Returns:
+    list: Translated text per chunk, None for chunks that failed, timed out or never ran.
+    """
+    chunks = Tokenize(content).sent_max_token()
+    # the extracted lines now live in the tokenizer's shared buffer
+    del content
+
+    executor = ThreadPoolExecutor(5)
+    futures = [executor.submit(translate_chunk, translate, deadline, chunk) for chunk in chunks]
+    try:
+        wait_for_chunks(futures, deadline)
+    finally:
+        # stop queued chunks and give the in-flight ones a bounded time to finish
+        deadline.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        drain_chunks(futures, deadline, DRAIN_GRACE_SECONDS)
+
+    return [collect_result(index, future) for index, future in enumerate(futures)]
+
+
+def install_signal_handlers(deadline):
+    """
+    Cancels the run on SIGINT/SIGTERM so partial results can still be stored.
+    A second signal aborts the run without waiting for the in-flight chunks.
+
+    Args:
+    - deadline (Deadline): Deadline of the whole run.
+
+    Returns:
+    dict: Previous handlers per signal, to be restored after the run.
+    """
+    def handler(signum, _frame):
+        if deadline.cancelled():
+            print(f"received signal {signum} again, not waiting for running chunks")
+            deadline.abort()
+            return
+        print(f"received signal {signum}, stopping translation")
+        deadline.cancel()
+
+    previous = {}
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        previous[signum] = signal.signal(signum, handler)
+    return previous
+
+
 def main():
     """
     Main function to execute the translation process.
@@ -107,13 +261,23 @@ def main():
     )
 
     file_path = collect_file(file_type)
-    status, output = execute(process, file_type, file_path, src, dest)
+    deadline = Deadline(RUN_TIMEOUT_SECONDS)
+    previous_handlers = install_signal_handlers(deadline)
+    try:
+        status, output = execute(process, file_type, file_path, src, dest, deadline)
+    finally:
+        for signum, previous in previous_handlers.items():
+            signal.signal(signum, previous)
     if not status:
         print(output)
-        return
+        sys.exit(1)
 
-    store_output_to_file(process, output)
+    missing = get_missing_chunks(output)
+    store_output_to_file(process, output, is_partial=bool(missing))
     print("Took %s seconds", time() - ts)
+    if missing:
+        print(f"translation incomplete, {len(missing)} of {len(output)} chunks missing : {missing}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
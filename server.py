@@ -0,0 +1,351 @@
+import json
+import os
+import signal
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from utility import (
+    TranslationServiceProvider,
+    FileDataExtractor,
+    Tokenize,
+)
+from config.server_config import (
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKER_COUNT,
+    SERVER_PROVIDER_CACHE_SIZE,
+    TRANSLATE_ENDPOINT,
+    HEALTH_ENDPOINT,
+)
+from config.openai_config import CHUNK_TIMEOUT_SECONDS
+from config.message_config import (
+    DefaultLanguages, ServerMessages, FileTypes, InvalidInputMessages
+)
+from deadline import Deadline
+from process import drain_chunks
+
+
+class RequestCoalescer:
+    """
+    Merges identical in-flight calls so concurrent callers share one upstream call.
+
+    Attributes:
+    - __executor (ThreadPoolExecutor): Executor running the upstream calls.
+    - __in_flight (dict): Mapping of request key to the pending Future.
+    - __lock (threading.Lock): Guards the in-flight mapping.
+    """
+
+    def __init__(self, executor) -> None:
+        """
+        Initializes the RequestCoalescer object.
+
+        Args:
+        - executor (ThreadPoolExecutor): Executor running the upstream calls.
+        """
+        self.__executor = executor
+        self.__in_flight = {}
+        self.__lock = threading.Lock()
+
+    def submit(self, key, func, *args):
+        """
+        Submits a call, or joins the pending call with the same key.
+
+        Args:
+        - key (hashable): Identity of the call.
+        - func (callable): Function performing the upstream call.
+        - *args: Arguments passed to func.
+
+        Returns:
+        Future: Future resolving to the call result.
+        """
+        with self.__lock:
+            future = self.__in_flight.get(key)
+            if future is not None:
+                return future
+            future = self.__executor.submit(func, *args)
+            self.__in_flight[key] = future
+        future.add_done_callback(lambda _f: self.__release(key, _f))
+        return future
+
+    def __release(self, key, future):
+        with self.__lock:
+            if self.__in_flight.get(key) is future:
+                del self.__in_flight[key]
+
+    def in_flight_count(self):
+        """
+        Returns:
+        int: Number of distinct calls currently in flight.
+        """
+        with self.__lock:
+            return len(self.__in_flight)
+
+    def in_flight_futures(self):
+        """
+        Returns:
+        list: Futures of the calls currently in flight.
+        """
+        with self.__lock:
+            return list(self.__in_flight.values())
+
+
+class TranslationServer(ThreadingHTTPServer):
+    """
+    Long-running HTTP server keeping translation providers, clients and tokenizer warm.
+
+    Attributes:
+    - executor (ThreadPoolExecutor): Worker pool shared by all requests.
+    - coalescer (RequestCoalescer): Merges identical in-flight chunk requests.
+    - processor_mapping (dict): Optional override of service names to processor classes.
+    - deadline (Deadline): Server-wide deadline, cancelled on shutdown.
+    """
+    daemon_threads = True
+
+    def __init__(self, server_address=(SERVER_HOST, SERVER_PORT),
+                 worker_count=SERVER_WORKER_COUNT, processor_mapping=None) -> None:
+        """
+        Initializes the TranslationServer object.
+
+        Args:
+        - server_address (tuple): Host and port to bind.
+        - worker_count (int): Number of upstream worker threads.
+        - processor_mapping (dict): Optional override of service names to processor classes,
+          e.g. stub backends for local testing.
+        """
+        super().__init__(server_address, TranslationRequestHandler)
+        self.executor = ThreadPoolExecutor(worker_count)
+        self.coalescer = RequestCoalescer(self.executor)
+        self.processor_mapping = processor_mapping
+        self.deadline = Deadline()
+        self.__providers = OrderedDict()
+        self.__providers_lock = threading.Lock()
+
+    def get_provider(self, service_name, src, dest):
+        """
+        Returns a cached TranslationServiceProvider for the service and language pair.
+        src and dest come from the query string, so the cache is bounded and the
+        least recently used provider is dropped once it is full.
+
+        Args:
+        - service_name (str): Service name.
+        - src (str): Source language.
+        - dest (str): Destination language.
+
+        Returns:
+        TranslationServiceProvider: provider object.
+        """
+        key = (service_name, src, dest)
+        with self.__providers_lock:
+            provider = self.__providers.get(key)
+            if provider is not None:
+                self.__providers.move_to_end(key)
+                return provider
+            provider = TranslationServiceProvider(
+                service_name=service_name, src_language=src, target_language=dest,
+                processor_mapping=self.processor_mapping,
+            )
+            if provider.verify_service_name()[0]:
+                self.__providers[key] = provider
+                if len(self.__providers) > SERVER_PROVIDER_CACHE_SIZE:
+                    self.__providers.popitem(last=False)
+            return provider
+
+    def translate_chunk(self, provider, chunk):
+        """
+        Translates one chunk, sharing the upstream call with identical in-flight chunks.
+
+        Args:
+        - provider (TranslationServiceProvider): provider object.
+        - chunk (TextChunk): chunk as yielded by Tokenize.sent_max_token.
+
+        Returns:
+        Future: Future resolving to the translated text.
+        """
+        _status, text = provider.format_input_text(chunk)
+        key = (provider.service_name, provider.src_language, provider.target_language, text)
+        return self.coalescer.submit(key, self.run_chunk, provider, text)
+
+    def run_chunk(self, provider, text):
+        """
+        Runs one upstream call with a per-chunk deadline started when a worker picks it up.
+
+        Args:
+        - provider (TranslationServiceProvider): provider object.
+        - text (str): chunk text.
+
+        Returns:
+        str: Translated text.
+        """
+        self.deadline.check()
+        return provider.get_translated_data(text, self.deadline.child(CHUNK_TIMEOUT_SECONDS))
+
+    def server_close(self):
+        super().server_close()
+        # stop queued chunks and give the in-flight ones a bounded time to finish
+        self.deadline.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        drain_chunks(self.coalescer.in_flight_futures(), self.deadline)
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles translation requests.
+
+    POST /translate?service=openai&src=English&dest=Hindi
+        body is raw utf-8 text, split into lines like an extracted file.
+    POST /translate?service=openai&file_type=pdf
+        body is the uploaded file content.
+
+    Results are streamed back as newline-delimited json, one object per chunk.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if urlparse(self.path).path == HEALTH_ENDPOINT:
+            self.send_json(200, {"status": "ok"})
+            return
+        self.send_json(404, {"error": ServerMessages.NOT_FOUND.value})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != TRANSLATE_ENDPOINT:
+            self.send_json(404, {"error": ServerMessages.NOT_FOUND.value})
+            return
+
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        service_name = params.get("service", "")
+        src = params.get("src", DefaultLanguages.DEFAULT_SOURCE_LANGUAGE.value)
+        dest = params.get("dest", DefaultLanguages.DEFAULT_TARGET_LANGUAGE.value)
+
+        content_length = self.get_content_length()
+        if content_length is None:
+            # the body was not read, so the connection cannot be reused
+            self.close_connection = True
+            self.send_json(400, {"error": ServerMessages.INVALID_CONTENT_LENGTH.value})
+            return
+
+        body = self.rfile.read(content_length)
+        if not body:
+            self.send_json(400, {"error": ServerMessages.EMPTY_REQUEST.value})
+            return
+
+        provider = self.server.get_provider(service_name, src, dest)
+        service_verify, msg = provider.verify_service_name()
+        if not service_verify:
+            self.send_json(400, {"error": msg})
+            return
+
+        status, chunks = self.tokenize_content(body, params.get("file_type"))
+        if not status:
+            self.send_json(400, {"error": chunks})
+            return
+
+        futures = [self.server.translate_chunk(provider, chunk) for chunk in chunks]
+        self.stream_results(futures)
+
+    def get_content_length(self):
+        """
+        Parses the Content-Length header.
+
+        Returns:
+        int: body length, 0 if the header is missing, None if it is not a non-negative integer.
+        """
+        value = self.headers.get("Content-Length", "0").strip()
+        if not (value.isascii() and value.isdigit()):
+            return None
+        return int(value)
+
+    def tokenize_content(self, body, file_type):
+        """
+        Extracts lines from the request body and splits them into chunks.
+
+        Args:
+        - body (bytes): Request body.
+        - file_type (str): File type of an uploaded file, None for raw text.
+
+        Returns:
+        tuple: Boolean indicating success or failure, and list of chunks or error message.
+        """
+        if file_type is None:
+            try:
+                text = body.decode("utf-8")
+            except UnicodeDecodeError:
+                return False, ServerMessages.INVALID_TEXT_ENCODING.value
+            return True, list(Tokenize(text.split("\n")).sent_max_token())
+
+        # checked before the file type is used in the temp file name
+        if file_type not in FileTypes.get_list():
+            return False, InvalidInputMessages.INVALID_FILE_TYPE.value
+
+        fd, file_path = tempfile.mkstemp(suffix=f".{file_type}")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(body)
+            # uploads are not cached, their text must not outlive the request
+            status, content = FileDataExtractor(
+                file_path=file_path, file_type=file_type, cache_folder=None
+            ).get_file_data()
+            if not status:
+                return status, content
+            # pdf lines are read lazily, so chunk them before the upload is removed
+            return True, list(Tokenize(content).sent_max_token())
+        except Exception as e:
+            return False, f"{ServerMessages.UNREADABLE_FILE.value} : {e}"
+        finally:
+            os.remove(file_path)
+
+    def stream_results(self, futures):
+        """
+        Streams chunk results in order using chunked transfer encoding.
+
+        Args:
+        - futures (list): Futures resolving to the translated text of each chunk.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for index, future in enumerate(futures):
+            try:
+                item = {"index": index, "text": future.result()}
+            except Exception as e:
+                item = {"index": index, "error": str(e)}
+            self.write_chunk(json.dumps(item, ensure_ascii=False) + "\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def send_json(self, code, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    """
+    Runs the translation server until interrupted.
+    """
+    server = TranslationServer()
+    print("Serving translations on http://%s:%s" % server.server_address)
+    # shutdown() blocks until serve_forever returns, so it cannot run on the serving thread
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: threading.Thread(target=server.shutdown).start())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import time
+import unittest
+
+from deadline import Deadline, DeadlineExceeded
+
+
+class DeadlineTest(unittest.TestCase):
+
+    def test_no_limit(self):
+        deadline = Deadline()
+
+        self.assertIsNone(deadline.remaining())
+        self.assertIsNone(deadline.child().remaining())
+        self.assertFalse(deadline.expired())
+
+    def test_child_is_bounded_by_its_parent(self):
+        parent = Deadline(1)
+
+        self.assertLessEqual(parent.child(60).remaining(), 1)
+        self.assertLessEqual(parent.child().remaining(), 1)
+        self.assertLessEqual(Deadline(60).child(1).remaining(), 1)
+
+    def test_remaining_is_never_negative(self):
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertEqual(Deadline(60, parent=deadline).remaining(), 0)
+        self.assertTrue(deadline.expired())
+
+    def test_check_stops_on_cancel_but_check_time_does_not(self):
+        parent = Deadline(60)
+        child = parent.child(30)
+        parent.cancel()
+
+        self.assertTrue(child.cancelled())
+        self.assertTrue(child.expired())
+        with self.assertRaises(DeadlineExceeded):
+            child.check()
+        # in-flight chunks only stop when their time is up
+        child.check_time()
+
+    def test_check_time_stops_when_expired(self):
+        child = Deadline(60).child(0.01)
+        time.sleep(0.02)
+
+        with self.assertRaises(DeadlineExceeded):
+            child.check_time()
+        with self.assertRaises(DeadlineExceeded):
+            child.check()
+
+    def test_abort_also_cancels(self):
+        parent = Deadline()
+        child = parent.child(30)
+        parent.abort()
+
+        self.assertTrue(child.cancelled())
+        self.assertTrue(child.aborted())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import file_processor
+from file_processor import DocProcessor, WORD_DOCUMENT_PATH
+
+
+WORD_NAMESPACE_URI = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def paragraph(*runs):
+    return "<w:p>{}</w:p>".format("".join(runs))
+
+
+def run(text):
+    return f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+class DocxTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+
+    def make_docx(self, body, name="document.docx"):
+        path = os.path.join(self.folder.name, name)
+        with zipfile.ZipFile(path, "w") as docx:
+            docx.writestr(
+                WORD_DOCUMENT_PATH,
+                f'<w:document xmlns:w="{WORD_NAMESPACE_URI}"><w:body>{body}</w:body></w:document>',
+            )
+        return path
+
+
+class ParseParagraphsTest(DocxTestCase):
+
+    def parse(self, body):
+        return list(DocProcessor(self.make_docx(body)).parse_paragraphs())
+
+    def test_text_box_keeps_outer_paragraph_text(self):
+        body = (
+            paragraph(run("Intro"))
+            + paragraph(
+                run("Before"),
+                "<w:r><w:pict><w:txbxContent>" + paragraph(run("Inner")) + "</w:txbxContent></w:pict></w:r>",
+                run("After"),
+            )
+            + paragraph(run("Outro"))
+        )
+        self.assertEqual(self.parse(body), ["Intro", "Inner", "BeforeAfter", "Outro"])
+
+    def test_table_cells(self):
+        rows = "".join(
+            "<w:tr><w:tc>{}</w:tc><w:tc>{}</w:tc></w:tr>".format(
+                paragraph(run(f"r{i}c0")), paragraph(run(f"r{i}c1"))
+            )
+            for i in range(3)
+        )
+        body = paragraph(run("Before")) + f"<w:tbl>{rows}</w:tbl>" + paragraph(run("After"))
+        self.assertEqual(
+            self.parse(body),
+            ["Before", "r0c0", "r0c1", "r1c0", "r1c1", "r2c0", "r2c1", "After"],
+        )
+
+    def test_tabs_and_line_breaks(self):
+        body = paragraph(
+            run("Question"), "<w:r><w:tab/></w:r>", run("(a)"),
+            "<w:r><w:br/></w:r>", run("second line"),
+        )
+        self.assertEqual(self.parse(body), ["Question\t(a)", "second line"])
+
+    def test_blank_paragraphs_are_dropped(self):
+        body = paragraph(run("One")) + "<w:p/>" + paragraph(run("   ")) + paragraph(run("Two"))
+        self.assertEqual(self.parse(body), ["One", "Two"])
+
+
+class FailingFile(io.StringIO):
+    """Cache file whose writes fail, e.g. on a full disk."""
+
+    def write(self, text):
+        raise OSError("no space left on device")
+
+
+class IterParagraphsTest(DocxTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache_folder = os.path.join(self.folder.name, "cache")
+        self.path = self.make_docx(paragraph(run("One")) + paragraph(run("Two")))
+
+    def extract(self, cache_folder):
+        return list(DocProcessor(self.path).iter_paragraphs(cache_folder))
+
+    def test_cache_miss_then_hit(self):
+        self.assertEqual(self.extract(self.cache_folder), ["One", "Two"])
+        entries = os.listdir(self.cache_folder)
+        self.assertEqual(len(entries), 1)
+        self.assertIn(f"_v{file_processor.DOCX_PARSER_VERSION}.txt", entries[0])
+
+        with mock.patch.object(DocProcessor, "parse_paragraphs", side_effect=AssertionError("parsed again")):
+            self.assertEqual(self.extract(self.cache_folder), ["One", "Two"])
+
+    def test_parser_version_change_is_a_cache_miss(self):
+        self.extract(self.cache_folder)
+        with mock.patch.object(file_processor, "DOCX_PARSER_VERSION", file_processor.DOCX_PARSER_VERSION + 1):
+            with mock.patch.object(DocProcessor, "parse_paragraphs", return_value=iter(["Reparsed"])):
+                self.assertEqual(self.extract(self.cache_folder), ["Reparsed"])
+
+    def test_disabled_cache_writes_nothing(self):
+        self.assertEqual(self.extract(None), ["One", "Two"])
+        self.assertFalse(os.path.exists(self.cache_folder))
+
+    def test_unavailable_cache_folder_falls_back_to_parsing(self):
+        # a regular file where the cache folder should be makes makedirs fail
+        blocked = os.path.join(self.folder.name, "blocked")
+        open(blocked, "w").close()
+        self.assertEqual(self.extract(os.path.join(blocked, "cache")), ["One", "Two"])
+
+    def test_failed_cache_write_still_extracts(self):
+        def failing_fdopen(fd, *args, **kwargs):
+            os.close(fd)
+            return FailingFile()
+
+        with mock.patch.object(file_processor.os, "fdopen", side_effect=failing_fdopen):
+            self.assertEqual(self.extract(self.cache_folder), ["One", "Two"])
+        self.assertEqual(os.listdir(self.cache_folder), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
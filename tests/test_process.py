@@ -0,0 +1,88 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import process
+import utility
+from deadline import Deadline
+from translation import Translation
+from utility import TranslationServiceProvider
+
+
+class WhitespaceEncoding:
+    """Offline stand-in for the tiktoken encoding: one token per word."""
+
+    def encode(self, text):
+        return text.split()
+
+
+class StubTranslate(Translation):
+    """Stub backend; chunks containing "slow" block until released."""
+
+    started = []
+    release = threading.Event()
+
+    def translate(self):
+        text = self._Translation__input_text
+        self.started.append(text)
+        if "slow" in text:
+            self.release.wait(10)
+        return text.upper()
+
+
+class TranslateContentTest(unittest.TestCase):
+
+    def setUp(self):
+        StubTranslate.started = []
+        StubTranslate.release.clear()
+        self.addCleanup(StubTranslate.release.set)
+        patches = [
+            mock.patch.object(utility, "get_encoding", return_value=WhitespaceEncoding()),
+            mock.patch.object(utility, "OPENAI_INPUT_TOKEN_LENGTH", 3),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.provider = TranslationServiceProvider(service_name="stub", processor_mapping={"stub": StubTranslate})
+
+    def run_cancelled(self, lines, deadline, after=0.2):
+        threading.Timer(after, deadline.cancel).start()
+        ts = time.monotonic()
+        output = process.translate_content(self.provider, lines, deadline)
+        return output, time.monotonic() - ts
+
+    def test_cancel_skips_queued_chunks(self):
+        lines = [f"slow line {i}" for i in range(20)]
+        deadline = Deadline()
+        # release the running chunks once the run is cancelled
+        threading.Timer(0.4, StubTranslate.release.set).start()
+        output, _seconds = self.run_cancelled(lines, deadline)
+
+        started = len(StubTranslate.started)
+        # only the chunks picked up by the five workers before the cancel ran
+        self.assertLessEqual(started, 5)
+        self.assertEqual(
+            sorted(item for item in output if item is not None),
+            sorted(line.upper() for line in StubTranslate.started),
+        )
+        self.assertEqual(process.get_missing_chunks(output), list(range(started, 20)))
+
+    def test_drain_is_bounded_by_the_grace_period(self):
+        with mock.patch.object(process, "DRAIN_GRACE_SECONDS", 0.3):
+            output, seconds = self.run_cancelled(["fast one two", "slow one two"], Deadline())
+
+        self.assertEqual(output, ["FAST ONE TWO", None])
+        self.assertLess(seconds, 5)
+
+    def test_abort_skips_the_drain(self):
+        deadline = Deadline()
+        threading.Timer(0.4, deadline.abort).start()
+        output, seconds = self.run_cancelled(["slow one two"], deadline)
+
+        self.assertEqual(output, [None])
+        self.assertLess(seconds, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import http.client
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import server
+import utility
+from server import TranslationServer
+from translation import Translation
+
+
+class WhitespaceEncoding:
+    """Offline stand-in for the tiktoken encoding: one token per word."""
+
+    def encode(self, text):
+        return text.split()
+
+
+class StubTranslate(Translation):
+    """Stub backend recording every upstream call."""
+
+    calls = []
+    calls_lock = threading.Lock()
+    release = threading.Event()
+
+    def translate(self):
+        text = self._Translation__input_text
+        with self.calls_lock:
+            self.calls.append(text)
+        self.release.wait(5)
+        # later chunks finish first, so the stream order is not the completion order
+        time.sleep(0.05 / (len(self.calls) + 1))
+        return text.upper()
+
+
+class TranslationServerTest(unittest.TestCase):
+
+    def setUp(self):
+        StubTranslate.calls = []
+        StubTranslate.release.set()
+        patches = [
+            mock.patch.object(utility, "get_encoding", return_value=WhitespaceEncoding()),
+            mock.patch.object(utility, "OPENAI_INPUT_TOKEN_LENGTH", 3),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.server = TranslationServer(("127.0.0.1", 0), processor_mapping={"openai": StubTranslate})
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def post(self, query, body):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=10)
+        self.addCleanup(connection.close)
+        connection.request("POST", f"/translate?{query}", body=body)
+        response = connection.getresponse()
+        return response.status, response.read().decode("utf-8")
+
+    def post_with_content_length(self, content_length):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=10)
+        self.addCleanup(connection.close)
+        connection.putrequest("POST", "/translate?service=openai")
+        connection.putheader("Content-Length", content_length)
+        connection.endheaders()
+        response = connection.getresponse()
+        return response.status, response.read().decode("utf-8")
+
+    def test_concurrent_identical_requests_share_one_upstream_call(self):
+        StubTranslate.release.clear()
+        responses = []
+        clients = [
+            threading.Thread(target=lambda: responses.append(self.post("service=openai", b"hello world")))
+            for _ in range(4)
+        ]
+        for client in clients:
+            client.start()
+        # let every request reach the coalescer before the upstream call returns
+        time.sleep(0.5)
+        StubTranslate.release.set()
+        for client in clients:
+            client.join(10)
+
+        self.assertEqual(StubTranslate.calls, ["hello world"])
+        self.assertEqual(len(responses), 4)
+        for status, body in responses:
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body), {"index": 0, "text": "HELLO WORLD"})
+
+    def test_results_stream_in_chunk_order(self):
+        lines = [f"line {i} text" for i in range(6)]
+        status, body = self.post("service=openai", "\n".join(lines).encode("utf-8"))
+
+        self.assertEqual(status, 200)
+        items = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([item["index"] for item in items], list(range(6)))
+        self.assertEqual([item["text"] for item in items], [line.upper() for line in lines])
+
+    def test_bad_requests_get_400(self):
+        cases = [
+            ("service=unknown", b"hello"),
+            ("service=openai", b"\xff\xfe"),
+            ("service=openai&file_type=x/../../y", b"hello"),
+            ("service=openai&file_type=docx", b"not a zip file"),
+        ]
+        for query, body in cases:
+            with self.subTest(query=query):
+                status, response = self.post(query, body)
+                self.assertEqual(status, 400)
+                self.assertIn("error", json.loads(response))
+        for content_length in ("abc", "-1", "1.5"):
+            with self.subTest(content_length=content_length):
+                status, response = self.post_with_content_length(content_length)
+                self.assertEqual(status, 400)
+                self.assertIn("error", json.loads(response))
+        self.assertEqual(StubTranslate.calls, [])
+
+    def test_provider_cache_is_bounded(self):
+        with mock.patch.object(server, "SERVER_PROVIDER_CACHE_SIZE", 2):
+            first = self.server.get_provider("openai", "English", "Hindi")
+            second = self.server.get_provider("openai", "English", "Tamil")
+            # touching the first pair keeps it over the second one
+            self.assertIs(self.server.get_provider("openai", "English", "Hindi"), first)
+            self.server.get_provider("openai", "English", "Bengali")
+            self.assertIs(self.server.get_provider("openai", "English", "Hindi"), first)
+            self.assertIsNot(self.server.get_provider("openai", "English", "Tamil"), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
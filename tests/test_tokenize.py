@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+import benchmark
+import utility
+from utility import Tokenize
+
+
+class WhitespaceEncoding:
+    """Offline stand-in for the tiktoken encoding: one token per word."""
+
+    def encode(self, text):
+        return text.split()
+
+
+class TokenizeTest(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(utility, "get_encoding", return_value=WhitespaceEncoding()),
+            mock.patch.object(benchmark, "get_encoding", return_value=WhitespaceEncoding()),
+            # benchmark.legacy_chunks reads its own import of the chunk size
+            mock.patch.object(utility, "OPENAI_INPUT_TOKEN_LENGTH", 5),
+            mock.patch.object(benchmark, "OPENAI_INPUT_TOKEN_LENGTH", 5),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_chunks_match_the_legacy_joined_chunks(self):
+        cases = {
+            "benchmark": list(benchmark.generate_lines(page_count=3, questions_per_page=2)),
+            "short lines": ["a", "b c", "d", "e f g", "h", "i"],
+            "long lines": ["a b c d e f", "g", "h i j k l m n", "o p"],
+            "empty lines": ["", "a b", "", "", "c d e", ""],
+            "single line": ["a b c"],
+            "batch boundary": [f"line {i}" for i in range(Tokenize.BATCH_SIZE * 2 + 3)],
+        }
+        for name, lines in cases.items():
+            with self.subTest(name):
+                legacy = [chunk[0] for chunk in benchmark.legacy_chunks(lines)]
+                chunks = list(Tokenize(lines).sent_max_token())
+                self.assertEqual([chunk.text for chunk in chunks], legacy)
+                self.assertEqual([chunk.index for chunk in chunks], list(range(len(legacy))))
+
+    def test_empty_chunk_has_zero_length(self):
+        chunk = Tokenize(["a", "b", "c"]).get_chunk(1, 1, 0)
+
+        self.assertEqual(len(chunk), 0)
+        self.assertEqual(chunk.text, "")
+        self.assertEqual(chunk.token_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
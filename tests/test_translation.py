@@ -0,0 +1,97 @@
+import unittest
+from unittest import mock
+
+import openai
+
+import translation
+from config.openai_config import RATE_LIMIT_WAIT_SECONDS
+from deadline import Deadline
+from translation import OpenAITranslate, GoogleCloudtranslate, stop_on_deadline
+
+
+def completion(content):
+    message = mock.Mock(content=content)
+    return mock.Mock(choices=[mock.Mock(message=message, finish_reason="stop")])
+
+
+class StopOnDeadlineTest(unittest.TestCase):
+
+    def retry_state(self, deadline):
+        translator = mock.Mock(deadline=deadline)
+        return mock.Mock(args=(translator,))
+
+    def test_keeps_retrying_without_a_limit(self):
+        self.assertFalse(stop_on_deadline(self.retry_state(Deadline())))
+
+    def test_keeps_retrying_with_time_for_another_wait(self):
+        self.assertFalse(stop_on_deadline(self.retry_state(Deadline(RATE_LIMIT_WAIT_SECONDS * 4))))
+
+    def test_stops_when_the_next_wait_would_pass_the_deadline(self):
+        self.assertTrue(stop_on_deadline(self.retry_state(Deadline(RATE_LIMIT_WAIT_SECONDS / 2))))
+        self.assertTrue(stop_on_deadline(self.retry_state(Deadline(60).child(0))))
+
+    def test_cancelling_the_run_does_not_stop_retries(self):
+        deadline = Deadline(60)
+        deadline.cancel()
+
+        self.assertFalse(stop_on_deadline(self.retry_state(deadline.child(30))))
+
+
+class OpenAITranslateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.create = mock.Mock()
+        client = mock.Mock()
+        client.with_options.return_value.chat.completions.create = self.create
+        patch = mock.patch.object(translation, "get_openai_client", return_value=client)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_revalidation_error_past_the_deadline_keeps_the_first_pass(self):
+        self.create.side_effect = [
+            completion("first pass"),
+            openai.APIConnectionError(request=mock.Mock()),
+        ]
+        # too little time left for another retry wait
+        deadline = Deadline(RATE_LIMIT_WAIT_SECONDS / 2)
+        translator = OpenAITranslate("English", "Hindi", "text", deadline)
+
+        self.assertEqual(translator.translate(), "first pass")
+        self.assertEqual(self.create.call_count, 2)
+
+    def test_revalidation_error_with_time_left_fails_the_chunk(self):
+        self.create.side_effect = [completion("first pass"), ValueError("bad response")]
+        translator = OpenAITranslate("English", "Hindi", "text", Deadline(60))
+
+        with self.assertRaises(ValueError):
+            translator.translate()
+
+
+class GoogleCloudtranslateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.get_languages.return_value = [
+            {"name": "English", "language": "en"},
+            {"name": "Hindi", "language": "hi"},
+        ]
+        patch = mock.patch.object(translation, "get_google_cloud_client", return_value=self.client)
+        patch.start()
+        self.addCleanup(patch.stop)
+        GoogleCloudtranslate.get_supported_languages.cache_clear()
+        self.addCleanup(GoogleCloudtranslate.get_supported_languages.cache_clear)
+
+    def test_request_timeout_is_bounded_by_the_deadline(self):
+        api_request = self.client._connection.api_request
+        api_request.return_value = {"data": {"translations": [{"translatedText": "anuvaad"}]}}
+        translator = GoogleCloudtranslate("English", "Hindi", "translation", Deadline(30))
+
+        self.assertEqual(translator.translate(), "anuvaad")
+        _args, kwargs = api_request.call_args
+        self.assertEqual(kwargs["data"], {"target": "hi", "q": ["translation"], "source": "en"})
+        self.assertLessEqual(kwargs["timeout"], 30)
+        self.client.translate.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
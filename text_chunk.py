@@ -0,0 +1,49 @@
+class TextChunk:
+    """
+    Compact view of one chunk inside a shared text buffer.
+
+    Attributes:
+    - buffer (str): Shared buffer the chunk points into.
+    - offset (int): Start position of the chunk in the buffer.
+    - length (int): Number of characters in the chunk.
+    - token_count (int): Number of tokens in the chunk, None if not counted.
+    - index (int): Position of the chunk in the document.
+    """
+    __slots__ = ("buffer", "offset", "length", "token_count", "index")
+
+    def __init__(self, buffer, offset, length, token_count, index) -> None:
+        """
+        Initializes the TextChunk object.
+
+        Args:
+        - buffer (str): Shared buffer the chunk points into.
+        - offset (int): Start position of the chunk in the buffer.
+        - length (int): Number of characters in the chunk.
+        - token_count (int): Number of tokens in the chunk, None if not counted.
+        - index (int): Position of the chunk in the document.
+        """
+        self.buffer = buffer
+        self.offset = offset
+        # an empty chunk (start == end) would otherwise leave out a separator it does not have
+        self.length = max(length, 0)
+        self.token_count = token_count
+        self.index = index
+
+    @property
+    def text(self):
+        """
+        Materializes the chunk text from the shared buffer.
+
+        Returns:
+        str: Chunk text.
+        """
+        return self.buffer[self.offset:self.offset + self.length]
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"TextChunk(index={self.index}, offset={self.offset}, length={self.length}, token_count={self.token_count})"
@@ -1,25 +1,83 @@
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from dotenv import load_dotenv
 
-from openai import OpenAI, RateLimitError, AsyncOpenAI
+from openai import OpenAI, RateLimitError, AsyncOpenAI, APIConnectionError, InternalServerError
 from googletrans import Translator
 from google.cloud import translate_v2 as translate
-from tenacity import retry, retry_if_exception_type, wait_fixed
+from tenacity import retry, retry_if_exception_type, wait_fixed, stop_after_attempt, stop_any
 
 from config.openai_config import (
     FIRST_PROMPT_INSTRUCTION, 
     VALIDATE_TRANSLATION_INSTRUCTION, 
-    MAXIMUM_RETRY_VALUE,
+    MAXIMUM_RATE_LIMIT_RETRIES,
+    RATE_LIMIT_WAIT_SECONDS,
     OPENAI_MODEL,
 )
+from deadline import Deadline, DeadlineExceeded
 
 load_dotenv()
 
+# errors retried by tenacity; APITimeoutError is an APIConnectionError
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+
+@lru_cache(maxsize=None)
+def get_openai_client():
+    """
+    Returns the process-wide OpenAI client so connections stay warm across chunks.
+    Retries are not configured here: every call goes through OpenAITranslate.get_client,
+    which turns the SDK's retries off in favour of the tenacity retry budget.
+
+    Returns:
+    OpenAI: OpenAI client object.
+    """
+    return OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+
+@lru_cache(maxsize=None)
+def get_google_cloud_client():
+    """
+    Returns the process-wide google cloud translate client.
+
+    Returns:
+    translate.Client: google cloud client object.
+    """
+    return translate.Client()
+
+
+def is_out_of_retry_time(deadline):
+    """
+    Args:
+    - deadline (Deadline): deadline of the call.
+
+    Returns:
+    bool: True if the deadline would pass during the next retry wait.
+    """
+    remaining = deadline.remaining()
+    return remaining is not None and remaining <= RATE_LIMIT_WAIT_SECONDS
+
+
+def stop_on_deadline(retry_state):
+    """
+    Tenacity stop condition: gives up when the translator's deadline would
+    pass during the next wait. Cancelling the run does not stop a chunk that
+    has already started, so its paid work is not thrown away.
+
+    Args:
+    - retry_state (RetryCallState): tenacity state, args[0] is the translator.
+
+    Returns:
+    bool: True if no further attempt should be made.
+    """
+    return is_out_of_retry_time(retry_state.args[0].deadline)
+
+
 class Translation(ABC):
     """Abstract Factory Interface"""
 
-    def __init__(self, src_language, target_language, input_text) -> None:
+    def __init__(self, src_language, target_language, input_text, deadline=None) -> None:
         """
         Initializes the Translation object.
 
@@ -27,10 +85,12 @@ class Translation(ABC):
         - src_language (str): Source language code.
         - target_language (str): Target language code.
         - input_text (str): Text to be translated.
+        - deadline (Deadline): Time budget for the translation, None for no limit.
         """
         self.__src_language = src_language
         self.__target_language = target_language
         self.__input_text = input_text
+        self.deadline = deadline or Deadline()
         
     @abstractmethod
     def translate(self):
@@ -46,8 +106,7 @@ class Translation(ABC):
 class OpenAITranslate(Translation):
     """Subclass of Translation for translation using OpenAI.
     * Attributes:
-        - __openai_key (str): OpenAI API key.
-        - __client (OpenAI): OpenAI client object.
+        - __client (OpenAI): shared OpenAI client object.
         - first_instruction (str): First prompt instruction for translation.
         - revalidate_instruction (str): Revalidation instruction for translation.
             
@@ -55,6 +114,7 @@ class OpenAITranslate(Translation):
         - src_language (str): Source language code.
         - target_language (str): Target language code.
         - input_text (str): Text to be translated.
+        - deadline (Deadline): Time budget for the translation.
     """
     
     
@@ -64,8 +124,7 @@ class OpenAITranslate(Translation):
         """
         super().__init__(*args, **kwargs)
         
-        self.__openai_key = os.environ.get("OPENAI_API_KEY")
-        self.__client =OpenAI(api_key=self.__openai_key, max_retries=MAXIMUM_RETRY_VALUE)
+        self.__client = get_openai_client()
         
         self.first_instruction = FIRST_PROMPT_INSTRUCTION.format(
                                     src_lang=self._Translation__src_language,
@@ -75,7 +134,27 @@ class OpenAITranslate(Translation):
                                     desc_lang=self._Translation__target_language
                                 )
 
-    @retry(retry=retry_if_exception_type(RateLimitError), wait=wait_fixed(5))
+    def get_client(self):
+        """
+        Returns the client with its request timeout bounded by the deadline.
+
+        The SDK's own retries are turned off, so the tenacity stop conditions
+        are the whole retry budget and one attempt never outlives the deadline.
+
+        Returns:
+        OpenAI: OpenAI client object.
+        """
+        remaining = self.deadline.remaining()
+        if remaining is None:
+            return self.__client.with_options(max_retries=0)
+        return self.__client.with_options(timeout=remaining, max_retries=0)
+
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=wait_fixed(RATE_LIMIT_WAIT_SECONDS),
+        stop=stop_any(stop_after_attempt(MAXIMUM_RATE_LIMIT_RETRIES), stop_on_deadline),
+        reraise=True,
+    )
     def first_conversion(self):
         """
         Perform the first conversion for translation.
@@ -83,8 +162,8 @@ class OpenAITranslate(Translation):
         Returns:
         str: Translated text from the first conversion.
         """
-        
-        response = self.__client.chat.completions.create(
+        self.deadline.check_time()
+        response = self.get_client().chat.completions.create(
         model=OPENAI_MODEL,
         
         messages=[
@@ -102,7 +181,12 @@ class OpenAITranslate(Translation):
         return response.choices[0].message.content
     
     
-    @retry(retry=retry_if_exception_type(RateLimitError), wait=wait_fixed(5))
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=wait_fixed(RATE_LIMIT_WAIT_SECONDS),
+        stop=stop_any(stop_after_attempt(MAXIMUM_RATE_LIMIT_RETRIES), stop_on_deadline),
+        reraise=True,
+    )
     def revalidate_conversion(self, first_translation_result):
         """
         Perform the revalidation conversion for translation.
@@ -113,7 +197,8 @@ class OpenAITranslate(Translation):
         Returns:
         str: Revalidated translated text.
         """
-        response = self.__client.chat.completions.create(
+        self.deadline.check_time()
+        response = self.get_client().chat.completions.create(
         model=OPENAI_MODEL,
         
         messages=[
@@ -137,7 +222,20 @@ class OpenAITranslate(Translation):
         Returns:
         str: Translated text.
         """
-        return self.revalidate_conversion(self.first_conversion())
+        first_translation_result = self.first_conversion()
+        try:
+            return self.revalidate_conversion(first_translation_result)
+        except DeadlineExceeded as e:
+            # keep the paid first pass when there is no time left to revalidate it
+            print(f"revalidation skipped : {e}")
+            return first_translation_result
+        except RETRYABLE_ERRORS as e:
+            # a timeout cut short by the deadline, or a retry stopped by it, is treated
+            # the same way; other failures still fail the chunk
+            if not is_out_of_retry_time(self.deadline):
+                raise
+            print(f"revalidation skipped : {e}")
+            return first_translation_result
 
 
 
@@ -154,10 +252,11 @@ class GoogleTranslate(Translation):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # the httpx request timeout is bounded by the deadline, None keeps the library default
         self.__g_translator = Translator(service_urls=[
             'translate.google.com',
             'translate.google.co.kr',
-            ])
+            ], timeout=self.deadline.remaining())
         
         
     def translate(self): 
@@ -167,6 +266,7 @@ class GoogleTranslate(Translation):
         Returns:
         str: Translated text.
         """
+        self.deadline.check_time()
         try:
             text_to_translate = self.__g_translator.translate(self._Translation__input_text, 
                                                         src= self._Translation__src_language,
@@ -197,12 +297,23 @@ class GoogleCloudtranslate(Translation):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.__g_translator = translate.Client()
+        self.__g_translator = get_google_cloud_client()
         self.src_lang = self.get_language_code(self._Translation__src_language)
         self.desc_lang = self.get_language_code(self._Translation__target_language)
        
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_supported_languages():
+        """
+        Fetches the supported language list once per process.
+
+        Returns:
+        tuple: supported language dicts with `name` and `language` keys.
+        """
+        return tuple(get_google_cloud_client().get_languages())
+
     def get_language_code(self, language:str):
-        lang_code_list = self.__g_translator.get_languages()
+        lang_code_list = self.get_supported_languages()
         target_obj = list(filter(lambda person: person['name'] == language.title(), lang_code_list))
         if not target_obj:
             print(f"Translation is not available for {language}")
@@ -220,14 +331,31 @@ class GoogleCloudtranslate(Translation):
         if isinstance(self._Translation__input_text, bytes):
             self._Translation__input_text = self._Translation__input_text.decode("utf-8")
 
-        # Text can also be a sequence of strings, in which case this method
-        # will return a sequence of results for each text.
-        result = self.__g_translator.translate(
-                self._Translation__input_text, 
-                target_language=self.desc_lang, 
-                source_language=self.src_lang
-        )
+        self.deadline.check_time()
 
-        return result["translatedText"]
+        remaining = self.deadline.remaining()
+        if remaining is None:
+            # Text can also be a sequence of strings, in which case this method
+            # will return a sequence of results for each text.
+            result = self.__g_translator.translate(
+                    self._Translation__input_text, 
+                    target_language=self.desc_lang, 
+                    source_language=self.src_lang
+            )
+            return result["translatedText"]
+
+        # Client.translate has no timeout argument, so the same v2 request is
+        # sent through its connection with the time left on the deadline
+        response = self.__g_translator._connection.api_request(
+                method="POST",
+                path="",
+                data={
+                    "target": self.desc_lang,
+                    "q": [self._Translation__input_text],
+                    "source": self.src_lang,
+                },
+                timeout=remaining,
+        )
+        return response["data"]["translations"][0]["translatedText"]
 
   
\ No newline at end of file
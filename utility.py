@@ -1,14 +1,32 @@
 import tiktoken 
 import os
+from array import array
+from functools import lru_cache
 from config.openai_config import OPENAI_MODEL, OPENAI_INPUT_TOKEN_LENGTH
+from config.file_config import CACHE_FOLDER_PATH
 
 from file_processor import PdfProcessor, DocProcessor
+from text_chunk import TextChunk
 from translation import OpenAITranslate, GoogleTranslate, GoogleCloudtranslate
 from config.message_config import (
     InvalidInputMessages, FileTypes, TranlatorTypes,
     DefaultLanguages
 )
 
+@lru_cache(maxsize=None)
+def get_encoding(model=OPENAI_MODEL):
+    """
+    Loads the tiktoken encoding for the model once per process.
+
+    Args:
+    - model (str): OpenAI model name.
+
+    Returns:
+    tiktoken.Encoding: Encoding object.
+    """
+    return tiktoken.encoding_for_model(model)
+
+
 class Tokenize:
     """
     Tokenizes text data.
@@ -16,40 +34,92 @@ class Tokenize:
     Attributes:
     - __token (str): Token for encoding.
     - __token_length (int): Length of the token.
-    - __file_data (list): List of text data.
-    - __file_length (int): Length of the text data list.
+    - __buffer (str): All text data joined into one shared buffer.
+    - __line_offsets (array): Start position of each line in the buffer.
+    - __line_tokens (array): Number of tokens in each line.
+    - __file_length (int): Number of lines in the text data.
     """
+    SEPARATOR = ", "
+    BATCH_SIZE = 1024
+
     def __init__(self, file_data) -> None:
         """
         Initializes the Tokenize object.
 
+        The lines are copied once into a shared buffer, so the caller can
+        release file_data as soon as the object is built.
+
         Args:
-        - file_data (list): List of text data.
+        - file_data (iterable): Lines of text data.
         """
-        self.__token = tiktoken.encoding_for_model(OPENAI_MODEL)
+        self.__token = get_encoding()
         self.__token_length = OPENAI_INPUT_TOKEN_LENGTH
-        self.__file_data = file_data
-        self.__file_length = len(file_data) 
+        self.__line_offsets = array("q")
+        self.__line_tokens = array("I")
+
+        # lines are joined in small batches so that only one batch of line
+        # objects is alive at a time while the shared buffer is built
+        segments = []
+        batch = []
+        position = 0
+        for line in file_data:
+            if self.__line_offsets:
+                position += len(self.SEPARATOR)
+            batch.append(line)
+            self.__line_offsets.append(position)
+            self.__line_tokens.append(len(self.__token.encode(line)))
+            position += len(line)
+            if len(batch) == self.BATCH_SIZE:
+                segments.append(self.SEPARATOR.join(batch))
+                batch = []
+        if batch:
+            segments.append(self.SEPARATOR.join(batch))
+
+        self.__buffer = self.SEPARATOR.join(segments)
+        del segments
+        self.__file_length = len(self.__line_offsets)
         print(self.__file_length)
-    
+
+    def get_chunk(self, start, end, index):
+        """
+        Builds the chunk covering lines start to end (exclusive).
+
+        Args:
+        - start (int): Index of the first line.
+        - end (int): Index after the last line.
+        - index (int): Position of the chunk in the document.
+
+        Returns:
+        TextChunk: View of the joined lines in the shared buffer.
+        """
+        offset = self.__line_offsets[start]
+        if end < self.__file_length:
+            length = self.__line_offsets[end] - len(self.SEPARATOR) - offset
+        else:
+            length = len(self.__buffer) - offset
+        token_count = sum(self.__line_tokens[start:end])
+        return TextChunk(self.__buffer, offset, length, token_count, index)
+
     def sent_max_token(self):
         """
         Iterates through the text data and yields sentences with maximum token length.
 
         Yields:
-        list: List containing sentences with maximum token length.
+        TextChunk: Chunk of sentences with maximum token length.
         """
         count = 0
         start = 0
+        index = 0
         for i in range(self.__file_length):
-            l= len(self.__token.encode(self.__file_data[i]))
+            l= self.__line_tokens[i]
             
             # 1. if the one element contents words of more than or equals to the chunk size then 
             # then particular element should be returned.
             # 2. if it reaches to file length then also same is applicable.
             if (l >= self.__token_length)  or (i==self.__file_length-1):
                 print(start, i+1)
-                yield [", ".join(self.__file_data[start:i+1])]
+                yield self.get_chunk(start, i+1, index)
+                index += 1
                 start = i+1
                 l = 0
                 count = 0
@@ -57,7 +127,8 @@ class Tokenize:
             count+=l
             if count>self.__token_length:
                 print(start, i)
-                yield [", ".join(self.__file_data[start:i])]
+                yield self.get_chunk(start, i, index)
+                index += 1
                 start = i 
                 count = 0 
             
@@ -70,18 +141,21 @@ class FileDataExtractor():
     Attributes:
     - file_path (str): File path.
     - file_type (str): File type.
+    - cache_folder (str): Folder caching extracted docx text, None to disable caching.
     """
     
-    def __init__(self, file_path, file_type) -> None:
+    def __init__(self, file_path, file_type, cache_folder=CACHE_FOLDER_PATH) -> None:
         """
         Initializes the FileDataExtractor object.
 
         Args:
         - file_path (str): File path.
         - file_type (str): File type.
+        - cache_folder (str): Folder caching extracted docx text, None to disable caching.
         """
         self.file_path = file_path
         self.file_type = file_type
+        self.cache_folder = cache_folder
         
         
     def get_file_data(self):
@@ -89,7 +163,8 @@ class FileDataExtractor():
         Retrieves data from the file.
 
         Returns:
-        tuple: Boolean indicating success or failure, and extracted file data.
+        tuple: Boolean indicating success or failure, and extracted file data
+        (an iterable of lines, read lazily).
         """
         
         if self.file_type not in ["pdf", "doc", "docx"]:
@@ -97,9 +172,9 @@ class FileDataExtractor():
         
         
         if "pdf" in self.file_type:
-            page_content = PdfProcessor(self.file_path).separate_data_per_line()
+            page_content = PdfProcessor(self.file_path).iter_data_per_line()
         else:
-            page_content = DocProcessor(self.file_path).extract_data()
+            page_content = DocProcessor(self.file_path).iter_paragraphs(self.cache_folder)
             
         return True, page_content
         
@@ -117,7 +192,8 @@ class TranslationServiceProvider():
     """
     def __init__(self, service_name,
                  src_language=DefaultLanguages.DEFAULT_SOURCE_LANGUAGE.value, 
-                 target_language=DefaultLanguages.DEFAULT_TARGET_LANGUAGE.value
+                 target_language=DefaultLanguages.DEFAULT_TARGET_LANGUAGE.value,
+                 processor_mapping=None
                 ) -> None:
         """
         Initializes the TranslationServiceProvider object.
@@ -126,9 +202,10 @@ class TranslationServiceProvider():
         - service_name (str): Service name.
         - src_language (str): Source language.
         - target_language (str): Target language.
+        - processor_mapping (dict): Optional override of service names to processor classes.
         """
         
-        self.__processor_mapping = {
+        self.__processor_mapping = processor_mapping or {
             "openai":OpenAITranslate,
             "google":GoogleCloudtranslate
         }
@@ -143,7 +220,8 @@ class TranslationServiceProvider():
         Returns:
         tuple: Boolean indicating success or failure, and error message if any.
         """
-        if self.service_name not in TranlatorTypes.get_list():
+        if self.service_name not in TranlatorTypes.get_list() \
+                or self.service_name not in self.__processor_mapping:
             return False, InvalidInputMessages.INVALID_SERVICE_TYPE.value
         return True, None
       
@@ -158,7 +236,10 @@ class TranslationServiceProvider():
         Returns:
         tuple: Boolean indicating success or failure, and formatted input text.
         """
-        if isinstance(input_text,list) and len(input_text)==1:
+        if isinstance(input_text, TextChunk):
+            return True, input_text.text
+
+        elif isinstance(input_text,list) and len(input_text)==1:
             input_text=input_text[0]
             return True, input_text
         
@@ -171,12 +252,13 @@ class TranslationServiceProvider():
             return False, ''
         
         
-    def get_translated_data(self, input_text):
+    def get_translated_data(self, input_text, deadline=None):
         """
         Retrieves translated data.
 
         Args:
         - input_text: Input text.
+        - deadline (Deadline): Time budget for the translation, None for no limit.
 
         Returns:
         str: Translated text.
@@ -185,7 +267,7 @@ class TranslationServiceProvider():
         if _status:
             service_class = self.__processor_mapping[self.service_name](
                 src_language=self.src_language, target_language=self.target_language, 
-                input_text=input_text
+                input_text=input_text, deadline=deadline
             )
             tranlated_text = service_class.translate()
             